@@ -1,12 +1,231 @@
 # src/dworshak_config/__main__.py
-try:
-    from .cli import app
-    #from .cli_typer import app
-    def run():
-        app()
-except ImportError:
-    #from .cli_stdlib import main as run
-    from .cli_argparse import main as run
+"""
+Entry point for the dworshak-config CLI.
+
+The common verbs (get, set, remove) and --version are served by a small
+hand-rolled parser that only imports the core class, so a config lookup
+does not pay for the Typer/Click/Rich import graph. Anything the fast path
+does not recognize (--help, list, helptree, unknown flags, wrong arity)
+falls through to the full Typer CLI, or to the argparse renderer when
+Typer is not installed.
+
+When a `dworshak-config serve` process is running (see cli_daemon.py),
+get and set are forwarded to it over its UNIX socket instead.
+"""
+import os
+import sys
+
+_COMMON_FLAGS = {
+    "--debug": ("debug", True),
+    "-d": ("debug", True),
+    "--verbose": ("verbose", True),
+    "-v": ("verbose", True),
+}
+
+_SET_FLAGS = {
+    **_COMMON_FLAGS,
+    "--overwrite": ("overwrite", True),
+    "--no-overwrite": ("overwrite", False),
+}
+
+_REMOVE_FLAGS = {
+    **_COMMON_FLAGS,
+    "--fail": ("fail", True),
+    "--yes": ("yes", True),
+    "-y": ("yes", True),
+}
+
+
+def _parse(args: list[str], n_positional: int, flags: dict):
+    """
+    Split raw arguments into positionals and options.
+
+    Returns None when anything is unexpected, meaning the full CLI
+    should handle the invocation (and produce the proper usage error).
+    """
+    positionals = []
+    options = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("--path", "-p"):
+            if i + 1 >= len(args):
+                return None
+            i += 1
+            options["path"] = args[i]
+        elif arg.startswith("--path="):
+            options["path"] = arg.split("=", 1)[1]
+        elif arg in flags:
+            key, value = flags[arg]
+            options[key] = value
+        elif arg.startswith("-") and arg != "-":
+            return None
+        else:
+            positionals.append(arg)
+        i += 1
+
+    if len(positionals) != n_positional:
+        return None
+    return positionals, options
+
+
+def _request_server(*fields: str):
+    """Forward to a running `dworshak-config serve`, if there is one."""
+    from .cli_daemon import request
+    return request(*fields)
+
+
+def _server_path(path) -> str:
+    # The server resolves paths against its own working directory
+    return os.path.abspath(path) if path else ""
+
+
+def _print_reply(reply: tuple[str, str]) -> int:
+    status, payload = reply
+    if status == "NOREPLY":
+        # A write may already have been applied, so it is not retried locally
+        sys.stderr.write(f"Error: {payload}; the change may or may not have been applied.\n")
+        return 1
+    if status == "ERR":
+        sys.stderr.write(f"Error: {payload}\n")
+        return 1
+    if status == "OK":
+        sys.stdout.write(f"{payload}\n")
+    return 0
+
+
+def _fast_get(args: list[str]):
+    parsed = _parse(args, 2, _COMMON_FLAGS)
+    if parsed is None:
+        return None
+    (service, item), options = parsed
+
+    reply = _request_server("GET", _server_path(options.get("path")), service, item)
+    # A read is safe to repeat locally when the server did not answer
+    if reply is not None and reply[0] != "NOREPLY":
+        return _print_reply(reply)
+
+    from .core import DworshakConfig
+    value = DworshakConfig(path=options.get("path")).get(service, item)
+    if value is not None:
+        # Only print the value to stdout for piping/capture
+        sys.stdout.write(f"{value}\n")
+    return 0
+
+
+def _fast_set(args: list[str]):
+    parsed = _parse(args, 3, _SET_FLAGS)
+    if parsed is None:
+        return None
+    (service, item, value), options = parsed
+    overwrite = options.get("overwrite", True)
+
+    reply = _request_server(
+        "SET", _server_path(options.get("path")), service, item, value,
+        "1" if overwrite else "0",
+    )
+    if reply is not None:
+        return _print_reply(reply)
+
+    from .core import DworshakConfig
+    stored_value = DworshakConfig(path=options.get("path")).set(
+        service=service,
+        item=item,
+        value=value,
+        overwrite=overwrite,
+    )
+    sys.stdout.write(f"{stored_value}\n")
+    return 0
+
+
+def _fast_remove(args: list[str]):
+    parsed = _parse(args, 2, _REMOVE_FLAGS)
+    if parsed is None:
+        return None
+    (service, item), options = parsed
+
+    if not options.get("yes", False):
+        if not sys.stdin.isatty():
+            sys.stderr.write("Refusing to remove unprompted; use --yes in non-interactive mode.\n")
+            return 2
+        try:
+            reply = input(f"Are you sure you want to remove {service}/{item}? [y/N]: ")
+        except EOFError:
+            reply = ""
+        if reply.strip().lower() not in {"y", "yes"}:
+            sys.stderr.write("Operation cancelled.\n")
+            return 0
+
+    from .core import DworshakConfig
+    deleted = DworshakConfig(path=options.get("path")).remove(service, item)
+    if deleted:
+        sys.stderr.write(f"Removed value {service}/{item}\n")
+        return 0
+    sys.stderr.write(f"No value found for {service}/{item}\n")
+    return 1 if options.get("fail", False) else 0
+
+
+def _fast_version(args: list[str]):
+    if args:
+        return None
+    from ._version import __version__
+    sys.stdout.write(f"{__version__}\n")
+    return 0
+
+
+def _fast_serve(args: list[str]):
+    if args:
+        return None
+    from .cli_daemon import serve
+    return serve()
+
+
+_FAST_PATHS = {
+    "--version": _fast_version,
+    "get": _fast_get,
+    "set": _fast_set,
+    "remove": _fast_remove,
+    "serve": _fast_serve,
+}
+
+
+def _run_full():
+    """Hand off to the full CLI: Typer when available, argparse otherwise."""
+    try:
+        from .cli import app
+        #from .cli_typer import app
+    except ImportError:
+        #from .cli_stdlib import main
+        from .cli_argparse import main
+        return main()
+    return app()
+
+
+def _run_fast(fast, args: list[str]):
+    """Run a fast-path handler with the same error policy as cli_argparse.dispatch."""
+    try:
+        return fast(args)
+    except KeyboardInterrupt:
+        sys.stderr.write("Interrupted.\n")
+        return 130
+    except Exception as exc:
+        sys.stderr.write(f"Error: {exc}\n")
+        if "--debug" in args or "-d" in args:
+            import traceback
+            traceback.print_exc()
+        return 1
+
+
+def run():
+    argv = sys.argv
+    if len(argv) > 1:
+        fast = _FAST_PATHS.get(argv[1])
+        if fast is not None:
+            code = _run_fast(fast, argv[2:])
+            if code is not None:
+                return code
+    return _run_full()
+
 
 if __name__ == "__main__":
-    run()
+    sys.exit(run())
@@ -0,0 +1,35 @@
+# src/dworshak_config/_rows.py
+"""
+Plain-text rendering of iterable command results, shared by the argparse
+and Typer renderers. Standard library only.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from typing import Any
+
+
+def _format_seq_row(row: tuple | list) -> str:
+    # Tab-separated, the shape set-many/remove-many read back
+    return "\t".join(map(str, row)) + "\n"
+
+
+def _format_scalar_row(row: Any) -> str:
+    return f"{row}\n"
+
+
+def write_rows(rows: Iterable[Any]) -> None:
+    """
+    Emit iterable result rows to stdout, one line each.
+
+    Each row is formatted on its own, so a string row is never mistaken
+    for a sequence of columns.
+    """
+    write = sys.stdout.write
+    for row in rows:
+        if isinstance(row, (tuple, list)):
+            write(_format_seq_row(row))
+        else:
+            write(_format_scalar_row(row))
@@ -1,26 +1,14 @@
 # src/dworshak_config/cli.py
 import typer
 from typer.models import OptionInfo
-from rich.console import Console
-from rich.table import Table
+import functools
 import os
+import sys
 from pathlib import Path
 from typing import Optional
-try:
-    from typer_helptree import add_typer_helptree
-except:
-    pass
 from .core import DworshakConfig
 from ._version import __version__
 
-console = Console(stderr=True)
-app = typer.Typer()
-
-# Force Rich to always enable colors, even when running from a .pyz bundle
-os.environ["FORCE_COLOR"] = "1"
-# Optional but helpful for full terminal feature detection
-os.environ["TERM"] = "xterm-256color"
-
 app = typer.Typer(
     name="dworshak-config",
     help=f"Store and retrieve plaintext two-key configuration values to JSON. (v{__version__})",
@@ -44,10 +32,27 @@ def main(ctx: typer.Context,
         typer.echo(__version__)
         raise typer.Exit(code=0)
 
-try:
-    add_typer_helptree(app=app, console=console, version = __version__,hidden=True)
-except:
-    pass
+
+@functools.cache
+def _console():
+    """Rich is only imported by the commands that actually print with it."""
+    # Force Rich to enable colors, even when running from a .pyz bundle,
+    # without clobbering the user's own settings
+    os.environ.setdefault("FORCE_COLOR", "1")
+    # Optional but helpful for full terminal feature detection
+    os.environ.setdefault("TERM", "xterm-256color")
+    from rich.console import Console
+    return Console(stderr=True)
+
+# helptree is hidden, so it only needs registering when it is invoked
+if "helptree" in sys.argv[1:]:
+    try:
+        from typer_helptree import add_typer_helptree
+    except ImportError:
+        pass
+    else:
+        add_typer_helptree(app=app, console=_console(), version = __version__,hidden=True)
+
 @app.command()
 def get(
     service: str = typer.Argument(..., help="The service name (e.g., Maxson)."),
@@ -84,22 +89,15 @@ def set(
     """
     config_mngr = DworshakConfig(path=path)
     
-    # Let the core class handle overwrite protection
-    config_mngr.set(
+    # Let the core class handle overwrite protection; it returns what is
+    # actually stored now
+    stored_value = config_mngr.set(
         service=service,
         item=item,
         value=value,
         overwrite=overwrite,
     )
-
-    # Read back what is actually stored now and print it
-    final_value = config_mngr.get(service, item)
-    if final_value is not None:
-        typer.echo(final_value)
-    else:
-        # Shouldn't happen after successful set, but defensive
-        console.print("[red]Failed to read back value[/red]", err=True)
-        raise typer.Exit(code=1)
+    typer.echo(stored_value)
 
 @app.command()
 def remove(
@@ -119,12 +117,17 @@ def remove(
     """Remove a config value."""
 
     config_manager = DworshakConfig(path=path)
+    console = _console()
     
     if not yes:
-        yes = typer.confirm(
-            f"Are you sure you want to remove {service}/{item}?",
-            default=False,  # ← [y/N] style — safe default
-        )
+        if not sys.stdin.isatty():
+            console.print("[red]Refusing to remove unprompted; use --yes in non-interactive mode.[/red]")
+            raise typer.Exit(code=2)
+        try:
+            reply = input(f"Are you sure you want to remove {service}/{item}? [y/N]: ")
+        except EOFError:
+            reply = ""
+        yes = reply.strip().lower() in {"y", "yes"}  # ← [y/N] style — safe default
     if not yes:
         console.print("[yellow]Operation cancelled.[/yellow]")
         raise typer.Exit(code=0)
@@ -138,6 +141,64 @@ def remove(
         console.print(f"[yellow]No value found for {service}/{item}[/yellow]")
 
 
+def _run_spec(handler, debug: bool, **kwargs) -> None:
+    """Call a spec handler with the same error policy as cli_argparse.dispatch."""
+    try:
+        handler(**kwargs)
+    except KeyboardInterrupt:
+        typer.echo("Interrupted.", err=True)
+        raise typer.Exit(code=130)
+    except Exception as e:
+        typer.echo(f"Error: {e}", err=True)
+        if debug:
+            import traceback
+            traceback.print_exc()
+        raise typer.Exit(code=1)
+
+
+@app.command(name="set-many")
+def set_many(
+    path: Optional[Path] = typer.Option(None, "--path", "-p", help="Config file path; created if missing."),
+    overwrite: bool = typer.Option(True, "--overwrite/--no-overwrite", help="Replace existing values."),
+    debug: bool = typer.Option(False, "--debug", "-d", help="Diagnostics."),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Details.")
+):
+    """Store values read from stdin, one service<TAB>item<TAB>value per line."""
+    from . import spec
+
+    _run_spec(spec.set_many, debug, path=path, overwrite=overwrite)
+
+
+@app.command(name="remove-many")
+def remove_many(
+    path: Optional[Path] = typer.Option(None, "--path", "-p", help="Config file path; must exist."),
+    yes: bool = typer.Option(
+        False,
+        "--yes","-y",
+        is_flag=True,
+        help="Skip confirmation prompt (required when stdin is piped)"
+    ),
+    debug: bool = typer.Option(False, "--debug", "-d", help="Diagnostics."),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Details.")
+):
+    """Remove values read from stdin, one service<TAB>item per line."""
+    from . import spec
+
+    if not yes:
+        if not sys.stdin.isatty():
+            typer.echo("Refusing to run 'remove-many' unprompted; use --yes in non-interactive mode.", err=True)
+            raise typer.Exit(code=2)
+        try:
+            reply = input("Are you sure you want to run 'remove-many'? [y/N]: ")
+        except EOFError:
+            reply = ""
+        if reply.strip().lower() not in {"y", "yes"}:
+            typer.echo("Operation cancelled.", err=True)
+            raise typer.Exit(code=0)
+
+    _run_spec(spec.remove_many, debug, path=path, yes=yes)
+
+
 @app.command(name = "list")
 def list_entries(
     path: Optional[Path] = typer.Option(None, "--path", "-p", help="Custom config file path."),
@@ -147,23 +208,37 @@ def list_entries(
     """List all stored values in a given config file."""
     config_manager = DworshakConfig(path=path)
     
-    # Access the raw data for efficient listing of values
-    # Assuming DworshakConfig follows the same _load() pattern
-    data = config_manager.load()
-    
+    # Service -> Items rows, streamed from the loaded config without a copy
+    rows = (
+        (service, item, str(value))
+        for service, item, value in config_manager.iter_entries(sort=True)
+    )
+
+    # Piped output: plain tab-separated rows on stdout, no Rich rendering
+    if not sys.stdout.isatty():
+        write = sys.stdout.write
+        for row in rows:
+            write("\t".join(row) + "\n")
+        return
+
+    from rich.table import Table
+
     table = Table(title=f"Stored Values ({config_manager.path})")
     table.add_column("Service", style="cyan")
     table.add_column("Item", style="green")
     table.add_column("Value", style="yellow")
     
-    # Nested iteration: Service -> Items
-    for service in sorted(data.keys()):
-        service_data = data[service]
-        for item in sorted(service_data.keys()):
-            value = str(service_data[item])
-            table.add_row(service, item, value)
+    for row in rows:
+        table.add_row(*row)
             
-    console.print(table)
+    _console().print(table)
+
+@app.command()
+def serve():
+    """Keep a warm server on a UNIX socket for batched get/set calls."""
+    from .cli_daemon import serve as serve_forever
+    raise typer.Exit(code=serve_forever())
+
 
 if __name__ == "__main__":
     app()
@@ -14,13 +14,17 @@ This file should contain *no domain logic*.
 from __future__ import annotations
 
 import argparse
+import functools
 import inspect
+import json
+import os
 import sys
-import traceback
 from typing import Any, Callable
-from typing import get_type_hints, get_origin, get_args
+from typing import get_origin, get_args
 from collections.abc import Iterable
+from pathlib import Path
 
+from ._rows import write_rows
 from .spec import COMMANDS, CommandSpec
 from ._version import __version__
 
@@ -38,9 +42,11 @@ def confirm(prompt: str) -> bool:
     """
     Minimal confirmation prompt.
 
-    Uses [y/N] semantics and fails closed on EOF
-    (important for non-interactive environments).
+    Uses [y/N] semantics and fails closed on EOF or when stdin is not
+    a terminal (important for non-interactive environments).
     """
+    if not sys.stdin.isatty():
+        return False
     try:
         reply = input(f"{prompt} [y/N]: ").strip().lower()
         return reply in {"y", "yes"}
@@ -51,13 +57,12 @@ def confirm(prompt: str) -> bool:
 # ────────────────────────────────────────────────────────────────
 # Argument inference
 # ────────────────────────────────────────────────────────────────
-def add_parameter(
-    parser: argparse.ArgumentParser,
+def parameter_arguments(
     param: inspect.Parameter,
     type_hints: dict[str, Any],
-) -> None:
+) -> tuple[tuple[str, ...], dict[str, Any]]:
     """
-    Translate a single function parameter into an argparse argument.
+    Translate a single function parameter into `add_argument` args/kwargs.
 
     Uses resolved runtime type hints (safe with __future__ annotations).
     """
@@ -95,13 +100,19 @@ def add_parameter(
         else:
             kwargs["type"] = arg_type if callable(arg_type) else str
 
-        parser.add_argument(long_flag, short_flag, **kwargs)
+        return (long_flag, short_flag), kwargs
 
-    else:
-        parser.add_argument(
-            name,
-            type=arg_type if callable(arg_type) else str,
-        )
+    return (name,), {"type": arg_type if callable(arg_type) else str}
+
+
+def add_parameter(
+    parser: argparse.ArgumentParser,
+    param: inspect.Parameter,
+    type_hints: dict[str, Any],
+) -> None:
+    """Translate a single function parameter into an argparse argument."""
+    flags, kwargs = parameter_arguments(param, type_hints)
+    parser.add_argument(*flags, **kwargs)
 
 def add_parameter_(
     parser: argparse.ArgumentParser,
@@ -151,12 +162,135 @@ def add_parameter_(
 # Parser construction
 # ────────────────────────────────────────────────────────────────
 
-def build_parser() -> argparse.ArgumentParser:
+ArgumentCalls = list[tuple[tuple[str, ...], dict[str, Any]]]
+CommandArguments = dict[str, ArgumentCalls]
+
+
+@functools.cache
+def spec_arguments(cmd: CommandSpec) -> ArgumentCalls:
+    """
+    The `add_argument` calls for one command, computed once per spec.
+
+    Callers must treat the returned kwargs dicts as read-only.
+    """
+    return [
+        parameter_arguments(param, cmd.type_hints)
+        for param in cmd.signature.parameters.values()
+    ]
+
+
+def command_arguments() -> CommandArguments:
+    """
+    Introspect every handler in the spec into its `add_argument` calls.
+
+    Keyed by command name; the result only holds plain, picklable values.
+    """
+    return {cmd.name: spec_arguments(cmd) for cmd in COMMANDS}
+
+
+def _parser_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "dworshak-config" / "parser.json"
+
+
+def _parser_cache_key() -> list[Any]:
+    """
+    Invalidate on a new release, a different Python, or any edit to the
+    spec module or to the argument inference in this one.
+
+    Built from JSON types only, so it compares equal after a round trip.
+    """
+    here = Path(__file__)
+    return [
+        __version__,
+        list(sys.version_info[:2]),
+        here.with_name("spec.py").stat().st_mtime_ns,
+        here.stat().st_mtime_ns,
+    ]
+
+
+# `type=` callables the cache may name; anything else is not cached
+_CACHE_TYPES: dict[str, Callable[[str], Any]] = {"str": str, "Path": Path}
+
+
+def _encode_arguments(arguments: CommandArguments) -> dict[str, Any] | None:
+    names = {cls: name for name, cls in _CACHE_TYPES.items()}
+    encoded: dict[str, Any] = {}
+    for command, calls in arguments.items():
+        encoded[command] = []
+        for flags, kwargs in calls:
+            kwargs = dict(kwargs)
+            if "type" in kwargs:
+                if kwargs["type"] not in names:
+                    return None
+                kwargs["type"] = names[kwargs["type"]]
+            encoded[command].append([list(flags), kwargs])
+    return encoded
+
+
+def _decode_arguments(encoded: dict[str, Any]) -> CommandArguments:
+    arguments: CommandArguments = {}
+    for command, calls in encoded.items():
+        arguments[command] = []
+        for flags, kwargs in calls:
+            if "type" in kwargs:
+                kwargs["type"] = _CACHE_TYPES[kwargs["type"]]
+            arguments[command].append((tuple(flags), kwargs))
+    return arguments
+
+
+def load_command_arguments() -> CommandArguments:
+    """
+    Return `command_arguments()`, reusing the on-disk cache when it is fresh.
+
+    The cache is plain JSON with `type=` callables stored by name, so
+    reading it can never run code. It is best-effort: any problem reading
+    or writing it falls back to introspecting the spec, which is always
+    correct.
+    """
+    try:
+        cache_path = _parser_cache_path()
+        key = _parser_cache_key()
+    except (OSError, RuntimeError):
+        return command_arguments()
+
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return _decode_arguments(cached["arguments"])
+    except Exception:
+        pass
+
+    arguments = command_arguments()
+    try:
+        encoded = _encode_arguments(arguments)
+        if encoded is None:
+            return arguments
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "arguments": encoded}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return arguments
+
+
+def build_parser(
+    arguments: CommandArguments | None = None,
+) -> argparse.ArgumentParser:
     """
     Build the top-level argparse parser from the command spec.
 
+    `arguments` may be supplied precomputed (see `load_command_arguments`);
+    otherwise the spec handlers are introspected directly.
+
     This function should remain free of domain knowledge.
     """
+    if arguments is None:
+        arguments = command_arguments()
+
     parser = argparse.ArgumentParser(
         prog="dworshak-config",
         description="Store and retrieve plaintext configuration values",
@@ -189,20 +323,76 @@ def build_parser() -> argparse.ArgumentParser:
 
         sub.add_argument("-h", "--help", action="help", help="Show this help message and exit")
 
-        #signature = inspect.signature(cmd.handler)
-        #for param in signature.parameters.values():
-        #    add_parameter(sub, param)
+        handler_params = []
+        for flags, kwargs in arguments[cmd.name]:
+            sub.add_argument(*flags, **kwargs)
+            handler_params.append(kwargs.get("dest", flags[0]))
 
-        signature = inspect.signature(cmd.handler)
-        type_hints = get_type_hints(cmd.handler)
+        # Attach spec object and accepted handler kwargs for dispatch
+        sub.set_defaults(
+            _command_spec=cmd,
+            _handler_params=frozenset(handler_params),
+        )
 
-        for param in signature.parameters.values():
-            add_parameter(sub, param, type_hints)
+    return parser
 
-        # Attach spec object for dispatch
-        sub.set_defaults(_command_spec=cmd)
 
-    return parser
+# ────────────────────────────────────────────────────────────────
+# argparse backport (Python < 3.13)
+# ────────────────────────────────────────────────────────────────
+
+_QUADRATIC_SCAN = """\
+        next_option_string_index = min([
+            index
+            for index in option_string_indices
+            if index >= start_index])
+"""
+
+# Same line count as the code it replaces, so later line numbers still match
+_LINEAR_SCAN = """\
+        next_option_string_index = start_index
+        while (next_option_string_index <= max_option_string_index
+               and next_option_string_index not in option_string_indices):
+            next_option_string_index += 1
+"""
+
+# Below this many arguments the quadratic scan costs less than the patch
+_PATCH_MIN_ARGS = 64
+
+
+def _patch_argparse_option_scan() -> None:
+    """
+    Backport the linear option scan from Python 3.13 (gh-116162).
+
+    Older `_parse_known_args` rebuilds and scans the full list of option
+    indices on every pass, which is quadratic in the number of optionals.
+    The method source is rewritten in place; if the private code does not
+    look exactly as expected, stdlib argparse is left untouched. Reading
+    and recompiling the source costs more than the scan saves on short
+    command lines, so main() only calls this for long ones.
+    """
+    if sys.version_info >= (3, 13):
+        return
+    try:
+        import ast
+        import textwrap
+
+        method = argparse.ArgumentParser._parse_known_args
+        lines, first_lineno = inspect.getsourcelines(method)
+        source = textwrap.dedent("".join(lines))
+        if source.count(_QUADRATIC_SCAN) != 1:
+            return
+
+        # Keep tracebacks pointing at the real lines of argparse.py
+        tree = ast.parse(source.replace(_QUADRATIC_SCAN, _LINEAR_SCAN))
+        ast.increment_lineno(tree, first_lineno - 1)
+
+        namespace: dict[str, Any] = {}
+        code = compile(tree, argparse.__file__, "exec")
+        exec(code, vars(argparse), namespace)
+        argparse.ArgumentParser._parse_known_args = namespace["_parse_known_args"]
+    except Exception:
+        pass
 
 
 # ────────────────────────────────────────────────────────────────
@@ -215,15 +405,16 @@ def dispatch(cmd: CommandSpec, args: argparse.Namespace) -> int:
 
     Returns an appropriate POSIX exit code.
     """
-    kwargs = vars(args).copy()
-    debug = kwargs.pop("debug", False)
-
-    # Internal argparse fields
-    kwargs.pop("_command_spec", None)
-    kwargs.pop("command", None)
+    # Only forward what the handler accepts (drops internal argparse fields)
+    handler_params = args._handler_params
+    kwargs = {k: v for k, v in vars(args).items() if k in handler_params}
+    debug = getattr(args, "debug", False)
 
     # Confirmation gate (policy lives in spec, UI lives here)
     if cmd.needs_confirmation and not kwargs.get("yes", False):
+        if not sys.stdin.isatty():
+            stderr(f"Refusing to run '{cmd.name}' unprompted; use --yes in non-interactive mode.")
+            return 2
         if not confirm(f"Are you sure you want to run '{cmd.name}'?"):
             stderr("Operation cancelled.")
             return 0
@@ -233,11 +424,7 @@ def dispatch(cmd: CommandSpec, args: argparse.Namespace) -> int:
         if result is not None:
             # Strings and bools are iterable-ish but not row data
             if isinstance(result, Iterable) and not isinstance(result, (str, bytes, bool)):
-                for row in result:
-                    if isinstance(row, (tuple, list)):
-                        print("  ".join(map(str, row)))
-                    else:
-                        print(row)
+                write_rows(result)
             # Non-iterable return values are treated as status only
 
         return 0
@@ -249,6 +436,7 @@ def dispatch(cmd: CommandSpec, args: argparse.Namespace) -> int:
     except Exception as exc:
         stderr(f"Error: {exc}")
         if debug:
+            import traceback
             traceback.print_exc()
         return 1
 
@@ -258,7 +446,14 @@ def dispatch(cmd: CommandSpec, args: argparse.Namespace) -> int:
 # ────────────────────────────────────────────────────────────────
 
 def main() -> int:
-    parser = build_parser()
+    # Answer version probes without building the parser
+    if sys.argv[1:] == ["--version"]:
+        sys.stdout.write(f"dworshak-config {__version__}\n")
+        return 0
+
+    parser = build_parser(load_command_arguments())
+    if len(sys.argv) > _PATCH_MIN_ARGS:
+        _patch_argparse_option_scan()
     args = parser.parse_args()
 
     if not hasattr(args, "_command_spec"):
@@ -0,0 +1,195 @@
+# src/dworshak_config/cli_daemon.py
+"""
+Optional long-running server for batched dworshak-config workflows.
+
+`dworshak-config serve` keeps one warm process listening on a UNIX socket,
+so scripted get/set calls skip interpreter and CLI start-up. The client
+side is deliberately tiny: `__main__` only calls `request()` when the
+socket file exists, and falls back to local file access on any failure.
+
+Wire format (one request per connection, fields separated by NUL):
+    request:  PING
+              GET  <path> <service> <item>
+              SET  <path> <service> <item> <value> <overwrite: 0|1>
+    response: OK [<value>]  |  NONE  |  ERR <message>
+
+Both ends time out: the server drops a client that does not finish
+sending within SERVER_TIMEOUT, and `request()` gives up after
+CLIENT_TIMEOUT, so one stalled client cannot hang every later call.
+
+This module depends only on the Python standard library.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+SOCKET_ENV = "DWORSHAK_CONFIG_SOCKET"
+
+# Seconds a connected client may take to send its request
+SERVER_TIMEOUT = 1.0
+# Seconds a client waits for a reply; longer than SERVER_TIMEOUT, so a
+# request queued behind one stalled client still gets its answer
+CLIENT_TIMEOUT = 5.0
+
+# request() status when the request was sent but no reply came back: the
+# server may or may not have applied it
+NO_REPLY = "NOREPLY"
+
+# ────────────────────────────────────────────────────────────────
+# Client
+# ────────────────────────────────────────────────────────────────
+
+def socket_path() -> Path:
+    """Socket location: $DWORSHAK_CONFIG_SOCKET, else ~/.dworshak/config.sock."""
+    env = os.environ.get(SOCKET_ENV)
+    if env:
+        return Path(env)
+    return Path.home() / ".dworshak" / "config.sock"
+
+
+def _recv_all(sock: Any) -> bytes:
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def request(*fields: str) -> tuple[str, str] | None:
+    """
+    Send one request to a running server.
+
+    Returns (status, payload), or None when no server is reachable (nothing
+    was sent, so the caller can safely do the work locally). If the server
+    accepted the connection but did not answer in time, the status is
+    NO_REPLY.
+    """
+    path = socket_path()
+    if not path.exists():
+        return None
+
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    with sock:
+        sock.settimeout(CLIENT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None
+        try:
+            sock.sendall("\0".join(fields).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            reply = _recv_all(sock)
+        except OSError as exc:
+            return NO_REPLY, f"No reply from server at {path}: {exc}"
+
+    if not reply:
+        return NO_REPLY, f"No reply from server at {path}"
+    status, _, payload = reply.decode("utf-8").partition("\0")
+    return status, payload
+
+
+# ────────────────────────────────────────────────────────────────
+# Server
+# ────────────────────────────────────────────────────────────────
+
+def handle_request(fields: list[str], configs: dict[str, Any]) -> str:
+    """
+    Answer one decoded request.
+
+    `configs` holds one DworshakConfig per requested path ("" for the
+    default), shared across requests for the lifetime of the server.
+    """
+    if fields == ["PING"]:
+        return "OK"
+    if len(fields) < 2:
+        return f"ERR\0Malformed request: {fields!r}"
+
+    verb, path, *args = fields
+    key = os.path.abspath(path) if path else ""
+    cfg = configs.get(key)
+    if cfg is None:
+        from .core import DworshakConfig
+        cfg = DworshakConfig(path=path or None)
+        # A path that fell back to the default (e.g. not created yet) is
+        # looked up again next time rather than pinned to the default
+        if not path or cfg.path == Path(path):
+            configs[key] = cfg
+
+    if verb == "GET" and len(args) == 2:
+        service, item = args
+        value = cfg.get(service, item)
+        return "NONE" if value is None else f"OK\0{value}"
+
+    if verb == "SET" and len(args) == 4:
+        service, item, value, overwrite = args
+        stored_value = cfg.set(service, item, value, overwrite=overwrite == "1")
+        return f"OK\0{stored_value}"
+
+    return f"ERR\0Unsupported request: {verb}"
+
+
+def serve() -> int:
+    """Run the server in the foreground until interrupted."""
+    import signal
+    import socket
+    import socketserver
+
+    if not hasattr(socket, "AF_UNIX"):
+        sys.stderr.write("dworshak-config serve requires UNIX domain sockets.\n")
+        return 1
+
+    path = socket_path()
+    if request("PING") is not None:
+        sys.stderr.write(f"A server is already listening on {path}\n")
+        return 1
+    # Left over from a server that did not shut down cleanly
+    if path.exists():
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    configs: dict[str, Any] = {}
+
+    class Handler(socketserver.StreamRequestHandler):
+        # Applied to the connection socket, so rfile.read() cannot block
+        # the (single-threaded) server forever
+        timeout = SERVER_TIMEOUT
+
+        def handle(self) -> None:
+            try:
+                raw = self.rfile.read()
+            except OSError:
+                # Client stalled without closing its side; drop it
+                return
+            try:
+                fields = raw.decode("utf-8").split("\0")
+                reply = handle_request(fields, configs)
+            except Exception as exc:
+                reply = f"ERR\0{exc}"
+            self.wfile.write(reply.encode("utf-8"))
+
+    server = socketserver.UnixStreamServer(str(path), Handler)
+    # Route SIGTERM through the cleanup below, like Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        os.chmod(path, 0o600)
+        sys.stderr.write(f"dworshak-config serving on {path} (Ctrl+C to stop)\n")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if path.exists():
+            path.unlink()
+    return 0
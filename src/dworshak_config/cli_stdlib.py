@@ -1,6 +1,5 @@
 import sys
 import argparse
-import traceback
 from pathlib import Path
 from typing import Optional
 
@@ -99,6 +98,7 @@ def main() -> int:
     except Exception as e:
         stdlib_notify(f"Error: {e}")
         if args.debug:
+            import traceback
             traceback.print_exc()
         return 1
 
@@ -12,11 +12,11 @@ This module:
 from __future__ import annotations
 
 import inspect
-import sys
-import traceback
-from typing import Any, Callable, get_type_hints
+from collections.abc import Iterable
+from typing import Any, Callable
 import typer
 
+from ._rows import write_rows
 from .spec import COMMANDS, CommandSpec
 
 
@@ -69,15 +69,9 @@ def dispatch(
             if isinstance(result, (str, bytes, bool)):
                 return
 
-            try:
-                for row in result:
-                    if isinstance(row, (tuple, list)):
-                        typer.echo("  ".join(map(str, row)))
-                    else:
-                        typer.echo(row)
-            except TypeError:
-                # Non-iterable return value → status only
-                pass
+            if isinstance(result, Iterable):
+                write_rows(result)
+            # Non-iterable return value → status only
 
     except KeyboardInterrupt:
         stderr("Interrupted.")
@@ -86,6 +80,7 @@ def dispatch(
     except Exception as exc:
         stderr(f"Error: {exc}")
         if debug:
+            import traceback
             traceback.print_exc()
         raise typer.Exit(code=1)
 
@@ -95,8 +90,8 @@ def dispatch(
 # ────────────────────────────────────────────────────────────────
 
 def register_command(cmd: CommandSpec) -> None:
-    raw_signature = inspect.signature(cmd.handler)
-    type_hints = get_type_hints(cmd.handler)
+    raw_signature = cmd.signature
+    type_hints = cmd.type_hints
 
     parameters = []
     for name, param in raw_signature.parameters.items():
@@ -1,68 +1,273 @@
 # src/dworshak_config/core.py
+from contextlib import contextmanager
 from pathlib import Path
+import errno
 import json
-import logging
-from typing import Any, List
+import os
+import stat
+from typing import Any, Iterable, Iterator
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; the stdlib json module is always the fallback
+    orjson = None
+
+_DEFAULT_CONFIG_PATH: Path | None = None
+
+
+def _default_path() -> Path:
+    """~/.dworshak/config.json, resolved on first use rather than at import."""
+    global _DEFAULT_CONFIG_PATH
+    if _DEFAULT_CONFIG_PATH is None:
+        _DEFAULT_CONFIG_PATH = Path.home() / ".dworshak" / "config.json"
+    return _DEFAULT_CONFIG_PATH
+
+
+def _logger():
+    # logging is only imported once there is something to report
+    import logging
+    return logging.getLogger(__name__)
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the former module-level names importable, computed lazily
+    if name == "DEFAULT_CONFIG_PATH":
+        return _default_path()
+    if name == "logger":
+        return _logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(config: dict) -> bytes:
+    """Both backends produce the same bytes: 2-space indent, sorted keys, UTF-8."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(config, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Make a rename inside `directory` durable (POSIX only, best-effort)."""
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _lock_fd(fd: int) -> None:
+    """Block until we hold an exclusive lock on `fd`."""
+    if os.name == "nt":
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                # LK_LOCK gives up after ~10 s of retries; keep waiting
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError as e:
+                if e.errno != errno.EDEADLOCK:
+                    raise
+    import fcntl
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_fd(fd: int) -> None:
+    if os.name == "nt":
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        return
+    import fcntl
+    fcntl.flock(fd, fcntl.LOCK_UN)
 
-DEFAULT_CONFIG_PATH = Path.home() / ".dworshak" / "config.json"
 
 class DworshakConfig:
     def __init__(self, path: str | Path | None = None):
-        if path and Path(path).exists() and str(path).endswith(".json"):
-            self.path = Path(path)
+        st = None
+        p = Path(path) if path else None
+        if p is not None and p.suffix == ".json":
+            try:
+                st = os.stat(p)
+            except OSError:
+                pass
+        if st is not None:
+            self.path = p
         else:
-            self.path = DEFAULT_CONFIG_PATH
+            self.path = _default_path()
+            st = None
+
+        # Parsed config and the (mtime_ns, size, inode) it was read at
+        self._cache: dict | None = None
+        self._cache_sig: tuple[int, int, int] | None = None
+        # The existence check above already stat'ed the file; the first
+        # _load reuses that result instead of stat'ing again
+        self._stat_hint: os.stat_result | None = st
+
+    def _load(self) -> dict:
+        """
+        Loads the nested JSON config, reusing the last parse while the file
+        is unchanged.
+
+        Returns the cached dict itself; callers that mutate it must save.
+        """
+        st, self._stat_hint = self._stat_hint, None
+        if st is None:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return {}
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if sig == self._cache_sig:
+            return self._cache
 
-    def load(self) -> dict:
-        """Loads the nested JSON config."""
-        if not self.path.exists():
-            return {}
         try:
-            with open(self.path, "r") as f:
-                data = json.load(f)
-                return data if isinstance(data, dict) else {}
-        except (json.JSONDecodeError, Exception) as e:
-            logger.warning(f"⚠️ Warning: Config file '{self.path}' is corrupted: {e}")
+            data = _loads(self.path.read_bytes())
+        except FileNotFoundError:
+            # Removed between the stat and the read
             return {}
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            _logger().warning(f"⚠️ Warning: Config file '{self.path}' is corrupted: {e}")
+            return {}
+        # Other OSErrors (e.g. EACCES) propagate: treating an unreadable file
+        # as empty would let the next save overwrite real data
+
+        if not isinstance(data, dict):
+            return {}
+        self._cache, self._cache_sig = data, sig
+        return data
+
+    def load(self) -> dict:
+        """Loads the nested JSON config (a copy, safe to modify)."""
+        return {
+            service: dict(items) if isinstance(items, dict) else items
+            for service, items in self._load().items()
+        }
+
+    def _target(self) -> Path:
+        """The config file with symlinks resolved (it need not exist yet)."""
+        return Path(os.path.realpath(self.path))
 
     def _save(self, config: dict):
-        """Saves the nested JSON config."""
+        """
+        Saves the nested JSON config atomically.
+
+        The JSON is written and fsynced to a temp file beside the config,
+        then renamed over it, so a crash never leaves a half-written file.
+        """
+        # Replace the file a symlinked config points at, not the link
+        # itself (dotfile managers such as stow and chezmoi rely on this)
+        target = self._target()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            mode = None
+
         try:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, "w") as f:
-                json.dump(config, f, indent=4)
-        except Exception as e:
-            logger.error(f"⚠️ Failed to save configuration to {self.path}: {e}")
+            try:
+                fd = os.open(tmp_path, flags, 0o666)
+            except FileExistsError:
+                # Left by an earlier crashed process that had our pid
+                os.unlink(tmp_path)
+                fd = os.open(tmp_path, flags, 0o666)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(config))
+                f.flush()
+                os.fsync(f.fileno())
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except BaseException:
+            # Whatever is on disk now, the cache no longer matches it
+            self._cache = self._cache_sig = None
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        _fsync_dir(target.parent)
+        st = os.stat(target)
+        self._cache = config
+        self._cache_sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    @contextmanager
+    def _locked_transact(self) -> Iterator[dict]:
+        """
+        Hold an exclusive lock on `<config>.lock` for a load/mutate/save.
+
+        Yields the freshly loaded config; the caller mutates it and calls
+        _save before the block ends. Concurrent writers (other CLI
+        invocations, the serve process) queue on the lock instead of
+        each saving over the other's update.
+        """
+        # Lock beside the real file, so writers reaching it through a
+        # symlink and through its own path share one lock
+        target = self._target()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = target.with_name(f"{target.name}.lock")
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            _lock_fd(fd)
+            try:
+                config = self._load()
+                try:
+                    yield config
+                except BaseException:
+                    # The cached dict may be half-mutated; force a re-read
+                    self._cache = self._cache_sig = None
+                    raise
+            finally:
+                _unlock_fd(fd)
+        finally:
+            os.close(fd)
 
     def get(self, service: str, item: str) -> str | None:
         """Pure I/O: Retrieve from JSON, return None if missing."""
-        config = self.load()
-        return config.get(service, {}).get(item)
-
-    def set(self, service: str, item: str, value: Any, overwrite: bool = True):
-        """Pure I/O: Store value in JSON."""
-        config = self.load()
-
-        if not overwrite and service in config and item in config[service]:
-            logger.warning(
-                f"Skipping set of {service}/{item} — already exists and overwrite=False"
-            )
-            return
-        """
-        if not overwrite:
-            if service in config and item in config[service]:
-                raise FileExistsError(
-                    f"Configuration for {service}/{item} already exists "
-                    f"(use overwrite=True to update)."
+        items = self._load().get(service)
+        return items.get(item) if items is not None else None
+
+    def set(self, service: str, item: str, value: Any, overwrite: bool = True) -> Any:
+        """
+        Pure I/O: Store value in JSON.
+
+        Returns:
+            The value now stored: `value`, or the existing value if
+            overwrite=False kept it.
+        """
+        with self._locked_transact() as config:
+            if not overwrite and service in config and item in config[service]:
+                _logger().warning(
+                    f"Skipping set of {service}/{item} — already exists and overwrite=False"
                 )
-        """        
-        # config.setdefault(service, {})[item] = value
-        if service not in config:
-            config[service] = {}
-        config[service][item] = value
-        self._save(config)
+                return config[service][item]
+            """
+            if not overwrite:
+                if service in config and item in config[service]:
+                    raise FileExistsError(
+                        f"Configuration for {service}/{item} already exists "
+                        f"(use overwrite=True to update)."
+                    )
+            """        
+            config.setdefault(service, {})[item] = value
+            self._save(config)
+        return value
 
     def remove(self, service: str, item: str) -> bool:
         """
@@ -71,27 +276,90 @@ class DworshakConfig:
         Returns:
             True if an entry was removed, False if it didn't exist.
         """
-        config = self.load()
-        if service not in config or item not in config[service]:
-            return False
+        with self._locked_transact() as config:
+            if service not in config or item not in config[service]:
+                return False
 
-        del config[service][item]
+            del config[service][item]
 
-        # Clean up empty service dicts (optional but nice)
-        if not config[service]:
-            del config[service]
+            # Clean up empty service dicts (optional but nice)
+            if not config[service]:
+                del config[service]
 
-        self._save(config)
+            self._save(config)
         return True
 
-    def list_configs(self) -> List[tuple[str, str]]:
+    def set_many(
+        self,
+        items: Iterable[tuple[str, str, Any]],
+        overwrite: bool = True,
+    ) -> int:
+        """
+        Store many (service, item, value) entries with one load and one save.
+
+        Returns:
+            The number of entries written; entries kept by overwrite=False
+            are skipped with a warning, as in `set`.
+        """
+        # Read all input before locking, so a slow producer (e.g. stdin at
+        # a terminal) cannot hold every other writer up
+        items = list(items)
+        written = 0
+        with self._locked_transact() as config:
+            for service, item, value in items:
+                if not overwrite and service in config and item in config[service]:
+                    _logger().warning(
+                        f"Skipping set of {service}/{item} — already exists and overwrite=False"
+                    )
+                    continue
+                config.setdefault(service, {})[item] = value
+                written += 1
+
+            if written:
+                self._save(config)
+        return written
+
+    def remove_many(self, keys: Iterable[tuple[str, str]]) -> int:
+        """
+        Remove many (service, item) entries with one load and one save.
+
+        Returns:
+            The number of entries that existed and were removed.
+        """
+        # Read all input before locking, as in set_many
+        keys = list(keys)
+        removed = 0
+        with self._locked_transact() as config:
+            for service, item in keys:
+                if service not in config or item not in config[service]:
+                    continue
+                del config[service][item]
+                if not config[service]:
+                    del config[service]
+                removed += 1
+
+            if removed:
+                self._save(config)
+        return removed
+
+    def iter_entries(self, sort: bool = True) -> Iterator[tuple[str, str, Any]]:
+        """
+        Yield every (service, item, value) straight from the loaded config,
+        without copying it. With sort=True, keys come out in sorted order.
+        """
+        config = self._load()
+        for service in (sorted(config) if sort else config):
+            items = config[service]
+            if not isinstance(items, dict):
+                continue
+            for item in (sorted(items) if sort else items):
+                yield service, item, items[item]
+
+    def list_configs(self) -> Iterator[tuple[str, str]]:
         """
-        Return a list of all (service, item) pairs that exist in the config.
+        Yield every (service, item) pair that exists in the config.
         """
-        config = self.load()
-        result = []
-        for service, items in config.items():
+        for service, items in self._load().items():
             if isinstance(items, dict):
                 for item in items:
-                    result.append((service, item))
-        return result
+                    yield service, item
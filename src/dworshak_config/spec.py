@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
+import sys
 from pathlib import Path
-from typing import Optional, Callable, Any, Iterable
+from typing import Optional, Callable, Any, Iterable, Iterator, get_type_hints
 
 from .core import DworshakConfig
 
@@ -17,7 +20,7 @@ class CommandSpec:
     Declarative command specification.
 
     Renderers (Typer, argparse, etc.) should:
-      - inspect `handler` signature + annotations
+      - read `signature` + `type_hints` (cached views of `handler`)
       - use `help` as command help
       - respect flags like `needs_confirmation`
     """
@@ -34,11 +37,58 @@ class CommandSpec:
         self.handler = handler
         self.needs_confirmation = needs_confirmation
 
+    @functools.cached_property
+    def signature(self) -> inspect.Signature:
+        """Handler signature, computed once and shared by all renderers."""
+        return inspect.signature(self.handler)
+
+    @functools.cached_property
+    def type_hints(self) -> dict[str, Any]:
+        """Resolved handler annotations, computed once per process."""
+        return get_type_hints(self.handler)
+
 
 # ────────────────────────────
 # Command handlers (THIS is the spec)
 # ────────────────────────────
 
+@functools.lru_cache(maxsize=8)
+def _cfg_for(path: Optional[Path]) -> DworshakConfig:
+    """
+    One DworshakConfig per path, so handlers driven repeatedly in one
+    process share its parsed-config cache instead of re-statting and
+    re-parsing. The path is resolved on first use only.
+    """
+    return DworshakConfig(path=path)
+
+
+def _cfg_at(path: Optional[Path], create: bool) -> DworshakConfig:
+    """
+    Like `_cfg_for`, but an explicit path is never swapped for the default
+    config: it is created first (create=True) or must already exist.
+    """
+    if path is not None:
+        path = Path(path)
+        if path.suffix != ".json":
+            raise ValueError(f"Config path must be a .json file: {path}")
+        if create:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with open(path, "x", encoding="utf-8") as f:
+                    f.write("{}\n")
+            except FileExistsError:
+                pass
+        elif not path.exists():
+            raise FileNotFoundError(f"No config file at {path}")
+
+    cfg = _cfg_for(path)
+    if path is not None and cfg.path != path:
+        # Cached from before the file existed, when it fell back to the default
+        _cfg_for.cache_clear()
+        cfg = _cfg_for(path)
+    return cfg
+
+
 def get(
     service: str,
     item: str,
@@ -49,7 +99,7 @@ def get(
     """
     Retrieve a configuration value (vault-style, two-key).
     """
-    cfg = DworshakConfig(path=path)
+    cfg = _cfg_for(path)
     value = cfg.get(service, item)
 
     if value is not None:
@@ -69,21 +119,17 @@ def set(
     """
     Store a configuration value (vault-style, two-key).
     """
-    cfg = DworshakConfig(path=path)
+    cfg = _cfg_for(path)
 
-    cfg.set(
+    # Returns what is actually stored (the existing value may win when
+    # overwrite=False), so no read-back is needed
+    stored_value = cfg.set(
         service=service,
         item=item,
         value=value,
         overwrite=overwrite,
     )
-
-    # Read back the stored value and emit to stdout
-    final_value = cfg.get(service, item)
-    if final_value is not None:
-        print(final_value)
-    else:
-        raise RuntimeError("Failed to read back stored value")
+    print(stored_value)
 
 
 def remove(
@@ -98,7 +144,7 @@ def remove(
     """
     Remove a configuration value.
     """
-    cfg = DworshakConfig(path=path)
+    cfg = _cfg_for(path)
 
     deleted = cfg.remove(service, item)
     if not deleted and fail:
@@ -107,6 +153,63 @@ def remove(
     return deleted
 
 
+def _stdin_rows() -> Iterator[list[str]]:
+    """
+    Non-blank stdin lines as [service, item(, value)], split on tabs.
+    The value is the rest of the line, so it may itself contain tabs.
+    """
+    for line in sys.stdin:
+        line = line.rstrip("\r\n")
+        if line:
+            yield line.split("\t", 2)
+
+
+def set_many(
+    path: Optional[Path] = None,
+    overwrite: bool = True,
+    debug: bool = False,
+    verbose: bool = False,
+):
+    """
+    Store many values read from stdin, one service<TAB>item<TAB>value
+    per line, with a single load and save. A --path file that does not
+    exist yet is created.
+    """
+    # Validate every row before touching the file, so bad input never
+    # leaves a newly created, empty config behind
+    entries = []
+    for row in _stdin_rows():
+        if len(row) != 3:
+            raise ValueError(f"Expected service<TAB>item<TAB>value, got: {row!r}")
+        entries.append((row[0], row[1], row[2]))
+
+    cfg = _cfg_at(path, create=True)
+    # Number of entries written, for scripting
+    print(cfg.set_many(entries, overwrite=overwrite))
+
+
+def remove_many(
+    path: Optional[Path] = None,
+    yes: bool = False,
+    debug: bool = False,
+    verbose: bool = False,
+):
+    """
+    Remove many values read from stdin, one service<TAB>item per line
+    (further columns are ignored), with a single load and save. A --path
+    file must already exist.
+    """
+    keys = []
+    for row in _stdin_rows():
+        if len(row) < 2:
+            raise ValueError(f"Expected service<TAB>item, got: {row!r}")
+        keys.append((row[0], row[1]))
+
+    cfg = _cfg_at(path, create=False)
+    # Number of entries removed, for scripting
+    print(cfg.remove_many(keys))
+
+
 def list_entries(
     path: Optional[Path] = None,
     debug: bool = False,
@@ -117,15 +220,9 @@ def list_entries(
 
     Returns iterable rows so renderers can decide formatting.
     """
-    cfg = DworshakConfig(path=path)
-    data = cfg.load()
-
-    for service in sorted(data.keys()):
-        items = data.get(service, {})
-        if not isinstance(items, dict):
-            continue
-        for item in sorted(items.keys()):
-            yield service, item, str(items[item])
+    cfg = _cfg_for(path)
+    for service, item, value in cfg.iter_entries(sort=True):
+        yield service, item, str(value)
 
 
 # ────────────────────────────
@@ -149,6 +246,17 @@ COMMANDS: list[CommandSpec] = [
         handler=remove,
         needs_confirmation=True,  # renderer decides how to ask
     ),
+    CommandSpec(
+        name="set-many",
+        help="Store configuration values read from stdin",
+        handler=set_many,
+    ),
+    CommandSpec(
+        name="remove-many",
+        help="Remove configuration values read from stdin",
+        handler=remove_many,
+        needs_confirmation=True,  # stdin carries data, so this means --yes
+    ),
     CommandSpec(
         name="list",
         help="List all stored configuration values",
@@ -0,0 +1,25 @@
+# tests/test_cli_argparse.py
+import json
+
+from dworshak_config import cli_argparse
+
+
+def test_parser_cache_round_trips_as_json(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    expected = cli_argparse.command_arguments()
+
+    assert cli_argparse.load_command_arguments() == expected
+    cache_file = tmp_path / "dworshak-config" / "parser.json"
+    assert json.loads(cache_file.read_text())["key"] == cli_argparse._parser_cache_key()
+
+    # Second call is served from the file
+    assert cli_argparse.load_command_arguments() == expected
+
+
+def test_corrupt_parser_cache_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_file = tmp_path / "dworshak-config" / "parser.json"
+    cache_file.parent.mkdir()
+    cache_file.write_text("not json")
+
+    assert cli_argparse.load_command_arguments() == cli_argparse.command_arguments()
@@ -0,0 +1,104 @@
+# tests/test_core.py
+import json
+import os
+
+import pytest
+
+from dworshak_config.core import DworshakConfig
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"db": {"host": "localhost", "port": "5432"}}))
+    return path
+
+
+def test_get_and_set_roundtrip(config_path):
+    cfg = DworshakConfig(path=config_path)
+    assert cfg.get("db", "host") == "localhost"
+    assert cfg.get("db", "missing") is None
+    assert cfg.get("missing", "host") is None
+
+    assert cfg.set("api", "token", "abc") == "abc"
+    assert DworshakConfig(path=config_path).get("api", "token") == "abc"
+
+
+def test_set_no_overwrite_returns_existing_value(config_path):
+    cfg = DworshakConfig(path=config_path)
+    assert cfg.set("db", "host", "remote", overwrite=False) == "localhost"
+    assert DworshakConfig(path=config_path).get("db", "host") == "localhost"
+
+
+def test_cache_sees_external_write(config_path):
+    cfg = DworshakConfig(path=config_path)
+    assert cfg.get("db", "host") == "localhost"
+
+    # Another process rewrites the file; the size changes with the value
+    config_path.write_text(json.dumps({"db": {"host": "db.example.internal"}}))
+    assert cfg.get("db", "host") == "db.example.internal"
+
+
+def test_load_returns_a_copy(config_path):
+    cfg = DworshakConfig(path=config_path)
+    snapshot = cfg.load()
+    snapshot["db"]["host"] = "changed"
+    snapshot["new"] = {}
+
+    assert cfg.get("db", "host") == "localhost"
+    assert "new" not in cfg.load()
+
+
+def test_failed_save_keeps_old_file_and_drops_cache(config_path, monkeypatch):
+    cfg = DworshakConfig(path=config_path)
+    before = config_path.read_bytes()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        cfg.set("db", "host", "remote")
+    monkeypatch.undo()
+
+    assert config_path.read_bytes() == before
+    assert cfg._cache is None
+    assert cfg.get("db", "host") == "localhost"
+    assert list(config_path.parent.glob("*.tmp")) == []
+
+
+def test_corrupted_file_loads_empty(config_path):
+    config_path.write_text("{not json")
+    assert DworshakConfig(path=config_path).load() == {}
+
+
+def test_remove_drops_empty_service(config_path):
+    cfg = DworshakConfig(path=config_path)
+    assert cfg.remove("db", "host") is True
+    assert cfg.remove("db", "host") is False
+    assert cfg.remove("db", "port") is True
+    assert "db" not in cfg.load()
+
+
+def test_bulk_set_and_remove(config_path):
+    cfg = DworshakConfig(path=config_path)
+    assert cfg.set_many([("a", "x", "1"), ("db", "host", "h")], overwrite=False) == 1
+    assert cfg.get("db", "host") == "localhost"
+    assert cfg.remove_many([("a", "x"), ("a", "missing")]) == 1
+    assert "a" not in cfg.load()
+
+
+def test_save_writes_through_symlink(tmp_path):
+    real = tmp_path / "dotfiles" / "real.json"
+    real.parent.mkdir()
+    real.write_text("{}")
+    link = tmp_path / "link.json"
+    try:
+        link.symlink_to(real)
+    except OSError:
+        pytest.skip("symlinks not permitted here")
+
+    DworshakConfig(path=link).set("svc", "item", "v")
+
+    assert link.is_symlink()
+    assert json.loads(real.read_text()) == {"svc": {"item": "v"}}
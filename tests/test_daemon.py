@@ -0,0 +1,57 @@
+# tests/test_daemon.py
+import json
+
+import pytest
+
+from dworshak_config.cli_daemon import handle_request
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"db": {"host": "localhost"}}))
+    return str(path)
+
+
+def test_ping():
+    assert handle_request(["PING"], {}) == "OK"
+
+
+def test_get(config_path):
+    configs = {}
+    assert handle_request(["GET", config_path, "db", "host"], configs) == "OK\0localhost"
+    assert handle_request(["GET", config_path, "db", "missing"], configs) == "NONE"
+    # One instance per path, reused across requests
+    assert list(configs) == [config_path]
+
+
+def test_set(config_path):
+    configs = {}
+    assert handle_request(["SET", config_path, "db", "host", "remote", "0"], configs) == "OK\0localhost"
+    assert handle_request(["SET", config_path, "db", "port", "5432", "1"], configs) == "OK\0" "5432"
+    with open(config_path) as f:
+        assert json.load(f) == {"db": {"host": "localhost", "port": "5432"}}
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["DELETE", "", "db", "host"],
+        ["GET", "", "db"],            # wrong arity for GET
+        ["SET", "", "db", "host"],    # wrong arity for SET
+    ],
+)
+def test_unsupported(fields):
+    assert handle_request(fields, {}).startswith("ERR\0Unsupported request")
+
+
+@pytest.mark.parametrize("fields", [[""], ["GET"]])
+def test_short_field_list(fields):
+    assert handle_request(fields, {}).startswith("ERR\0Malformed request")
+
+
+def test_fallback_path_is_not_cached(tmp_path):
+    configs = {}
+    missing = str(tmp_path / "later.json")
+    handle_request(["GET", missing, "db", "host"], configs)
+    assert configs == {}
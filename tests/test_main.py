@@ -0,0 +1,92 @@
+# tests/test_main.py
+import json
+import sys
+
+import pytest
+
+from dworshak_config import __main__ as main
+from dworshak_config.__main__ import _COMMON_FLAGS, _REMOVE_FLAGS, _SET_FLAGS, _parse
+
+
+@pytest.fixture(autouse=True)
+def no_server(tmp_path, monkeypatch):
+    # Never forward to a `dworshak-config serve` running on this machine
+    monkeypatch.setenv("DWORSHAK_CONFIG_SOCKET", str(tmp_path / "absent.sock"))
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"db": {"host": "localhost"}}))
+    return path
+
+
+def test_parse_positionals_and_path_forms():
+    assert _parse(["db", "host", "-p", "c.json"], 2, _COMMON_FLAGS) == (
+        ["db", "host"], {"path": "c.json"},
+    )
+    assert _parse(["--path=c.json", "db", "host", "-d"], 2, _COMMON_FLAGS) == (
+        ["db", "host"], {"path": "c.json", "debug": True},
+    )
+    assert _parse(["db", "host", "v", "--no-overwrite"], 3, _SET_FLAGS) == (
+        ["db", "host", "v"], {"overwrite": False},
+    )
+    # A lone "-" is a value, not a flag
+    assert _parse(["db", "host", "-"], 3, _SET_FLAGS) == (["db", "host", "-"], {})
+
+
+@pytest.mark.parametrize(
+    "args, n_positional, flags",
+    [
+        (["db"], 2, _COMMON_FLAGS),                       # too few
+        (["db", "host", "extra"], 2, _COMMON_FLAGS),      # too many
+        (["db", "host", "--unknown"], 2, _COMMON_FLAGS),  # unknown flag
+        (["db", "host", "--help"], 2, _COMMON_FLAGS),     # help is the full CLI's
+        (["db", "host", "-p"], 2, _COMMON_FLAGS),         # missing --path value
+        (["db", "host", "--overwrite"], 2, _COMMON_FLAGS),  # set-only flag on get
+        (["db", "host", "--yes"], 2, _SET_FLAGS),         # remove-only flag on set
+    ],
+)
+def test_parse_falls_through(args, n_positional, flags):
+    assert _parse(args, n_positional, flags) is None
+
+
+def test_run_hands_unrecognized_invocations_to_full_cli(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dworshak-config", "get", "db", "--bogus"])
+    monkeypatch.setattr(main, "_run_full", lambda: "full")
+    assert main.run() == "full"
+
+
+def test_fast_get_prints_value(config_path, capsys):
+    assert main._fast_get(["db", "host", "-p", str(config_path)]) == 0
+    assert capsys.readouterr().out == "localhost\n"
+
+
+def test_fast_set_no_overwrite_prints_existing_value(config_path, capsys):
+    assert main._fast_set(["db", "host", "remote", "--no-overwrite", "-p", str(config_path)]) == 0
+    assert capsys.readouterr().out == "localhost\n"
+    assert json.loads(config_path.read_text()) == {"db": {"host": "localhost"}}
+
+
+def test_fast_remove_refuses_without_yes_when_not_a_tty(config_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys.stdin, "isatty", lambda: False, raising=False)
+    assert main._fast_remove(["db", "host", "-p", str(config_path)]) == 2
+    assert "--yes" in capsys.readouterr().err
+    assert main._fast_remove(["db", "host", "--yes", "-p", str(config_path)]) == 0
+    assert json.loads(config_path.read_text()) == {}
+
+
+def test_errors_are_reported_without_traceback(tmp_path, monkeypatch, capsys):
+    # A directory with a .json name: stat succeeds, reading it fails
+    bad = tmp_path / "d.json"
+    bad.mkdir()
+
+    monkeypatch.setattr(sys, "argv", ["dworshak-config", "get", "a", "b", "-p", str(bad)])
+    assert main.run() == 1
+    err = capsys.readouterr().err
+    assert err.startswith("Error: ")
+    assert "Traceback" not in err
+
+    monkeypatch.setattr(sys, "argv", ["dworshak-config", "get", "a", "b", "-p", str(bad), "-d"])
+    assert main.run() == 1
+    assert "Traceback" in capsys.readouterr().err
@@ -0,0 +1,34 @@
+# tests/test_spec.py
+import io
+import json
+import sys
+
+import pytest
+
+from dworshak_config import spec
+
+
+def test_set_many_creates_path_instead_of_default(tmp_path, monkeypatch, capsys):
+    target = tmp_path / "sub" / "new.json"
+    monkeypatch.setattr(sys, "stdin", io.StringIO("a\tb\t1\nc\td\tx\ty\n"))
+
+    spec.set_many(path=target)
+
+    assert capsys.readouterr().out == "2\n"
+    assert json.loads(target.read_text()) == {"a": {"b": "1"}, "c": {"d": "x\ty"}}
+
+
+def test_set_many_bad_row_leaves_no_file(tmp_path, monkeypatch):
+    target = tmp_path / "new.json"
+    monkeypatch.setattr(sys, "stdin", io.StringIO("a\tb\t1\nbad\n"))
+
+    with pytest.raises(ValueError, match="service<TAB>item<TAB>value"):
+        spec.set_many(path=target)
+    assert not target.exists()
+
+
+def test_remove_many_requires_existing_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("a\tb\n"))
+
+    with pytest.raises(FileNotFoundError):
+        spec.remove_many(path=tmp_path / "missing.json", yes=True)